@@ -0,0 +1,680 @@
+"""
+auto-obs-srt-bitrate-rtt-alert v1.0.0 (shared module)
+
+This program monitors the bitrate and RTT (Round Trip Time) of an SRT server,
+and automatically shows/hides specific sources in OBS scenes when values fall below/rise above thresholds.
+
+Required packages:
+- obs-websocket-py
+- requests
+
+Configuration file (abc_config.json) must be in the same directory as the program.
+Run through auto-obs-srt-bitrate-rtt-alert_en.py or auto-obs-srt-bitrate-rtt-alert_kr.py,
+which select the message language (see strings.py).
+"""
+
+import time
+import random
+import requests
+import json
+import queue
+import http.client
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from obswebsocket import obsws, requests as obsrequests
+from websocket import WebSocketConnectionClosedException
+import threading
+import logging
+from strings import STRINGS
+
+# Version information
+VERSION = "1.0.0"
+
+# Polling interval (seconds)
+POLL_INTERVAL = 2.0
+
+# OBS WebSocket ping interval (seconds)
+OBS_PING_INTERVAL = 10
+
+# Initial stabilization period after stream start (seconds)
+INITIAL_SKIP_SECONDS = 15
+
+# Request headers for the SRT stats URL
+STATS_HEADERS = {"Connection": "keep-alive", "Accept-Encoding": "identity"}
+
+# Configuration schema: field -> (allowed types, exclusive lower bound)
+CONFIG_SCHEMA = {
+    "STATS_URL": (str, None),
+    "PUBLISHER": (str, None),
+    "OBS_HOST": (str, None),
+    "OBS_PORT": (int, 0),
+    "OBS_PASSWORD": (str, None),
+    "SOURCE_NAME": (str, None),
+    "SCENE_NAME": (str, None),
+    "BITRATE_THRESHOLD": ((int, float), 0),
+    "RTT_THRESHOLD": ((int, float), 1),
+    "COOLDOWN_SECONDS": ((int, float), 0),
+    "SOURCE_DISPLAY_TIME": ((int, float), 1),
+}
+
+# Disable unnecessary log messages from OBS WebSocket library
+logging.getLogger('websockets.client').setLevel(logging.ERROR)
+logging.getLogger('obswebsocket').setLevel(logging.ERROR)
+
+# Program logger setup
+logger = logging.getLogger(__name__)
+handler = logging.StreamHandler()
+formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+class BitrateMonitor:
+    # Fixed attribute layout (no per-instance __dict__; faster attribute access in the polling loop)
+    __slots__ = (
+        # Configuration
+        '_t', 'config', '_bitrate_threshold', '_rtt_threshold', '_cooldown', '_display_time',
+        '_scene_name', '_source_name', '_stats_url', '_stats_path', '_publisher',
+        # SRT stats
+        'session', '_conn', 'server_connected', 'server_retry_count', 'server_retry_delay',
+        'bitrate_none_logged', '_next_tick', '_skip_until', '_sample_q',
+        # OBS
+        'ws', 'is_connected', 'obs_retry_count', 'obs_retry_delay', '_last_ping',
+        'source_id', '_scene_item_ids', '_show_payload', '_hide_payload', '_current_visible', '_obs_q', '_obs_lock',
+        # Warning
+        'last_sent_time', 'warning_active', '_warning_label', '_warning_clear', '_hide_pending', '_hide_lock',
+    )
+
+    def __init__(self, config_path, locale="en"):
+        """Initialize function
+        
+        Args:
+            config_path (str): Path to configuration file
+            locale (str): Message language ("en" or "kr")
+        """
+        self._t = STRINGS[locale]  # Localized messages
+        self.config = self._load_config(config_path)
+        self._validate_config(self.config)
+        # SRT stats client: persistent http.client connection for plain http://host[:port]/path URLs,
+        # requests session for HTTPS, URLs with credentials, or when an HTTP(S)_PROXY setting applies
+        # (a redirecting URL is switched to the session on its first redirect)
+        stats_url = urlsplit(self._stats_url)
+        self._stats_path = (stats_url.path or "/") + (f"?{stats_url.query}" if stats_url.query else "")  # Request path for plain HTTP
+        if (stats_url.scheme == "http" and stats_url.username is None
+                and not requests.utils.get_environ_proxies(self._stats_url)):
+            self.session = None
+            self._conn = http.client.HTTPConnection(stats_url.hostname, stats_url.port, timeout=1)  # Plain HTTP stats connection (keep-alive)
+        else:
+            self.session = self._create_session()  # Stats session (keep-alive)
+            self._conn = None
+        self.ws = None                    # OBS WebSocket connection object
+        self.last_sent_time = float("-inf")  # Last warning time (monotonic)
+        self._skip_until = 0.0  # Skip checks until this time (monotonic, 0 = not started)
+        self.warning_active = False       # Warning activation status
+        self.bitrate_none_logged = False  # Bitrate none logged status
+        self.server_connected = False     # Server connection status
+        self.server_retry_count = 0       # Server reconnection attempt count
+        self.obs_retry_count = 0          # OBS reconnection attempt count
+        self.server_retry_delay = 0       # Wait time before next server reconnection
+        self.obs_retry_delay = 0          # Wait time before next OBS reconnection
+        self.source_id = None             # OBS source ID cache
+        self._scene_item_ids = {}  # {sourceName: sceneItemId} for the scene
+        self._show_payload = None  # SetSceneItemEnabled arguments (show)
+        self._hide_payload = None  # SetSceneItemEnabled arguments (hide)
+        self._current_visible = None  # Last applied warning visibility (None = unknown)
+        self._warning_label = None  # Label of the current warning (used in end log)
+        self._warning_clear = threading.Event()  # Set to extend the current warning display
+        self._hide_pending = False  # Hide waiter is still waiting (display can be extended)
+        self._hide_lock = threading.Lock()  # Guards _hide_pending against the waiter finishing
+        self.is_connected = False         # OBS connection status
+        self._last_ping = 0.0  # Last OBS ping time (monotonic)
+        self._next_tick = time.monotonic()  # Next polling deadline (monotonic)
+        self._sample_q = queue.Queue(maxsize=1)  # Newest (bitrate, RTT) sample from the sampler thread
+        self._obs_q = queue.Queue()  # Pending warning visibility changes for the OBS worker
+        self._obs_lock = threading.Lock()  # Guards swapping the OBS WebSocket and its per-connection caches
+        self.connect_to_obs()             # Initial OBS connection
+
+    def _validate_config(self, config):
+        """Validate configuration values
+        
+        Args:
+            config (dict): Configuration dictionary
+            
+        Raises:
+            ValueError: If configuration values are invalid
+        """
+        # Type and range check for all fields in one pass (bool is rejected even though it is an int;
+        # comparisons are written positively so NaN, which compares False, is rejected too)
+        for field, (types, lower_bound) in CONFIG_SCHEMA.items():
+            value = config[field]
+            if types is str:
+                if not (isinstance(value, str) and value):
+                    raise ValueError(self._t["config_strings_invalid"])
+            elif isinstance(value, bool) or not isinstance(value, types) or not value > lower_bound:
+                raise ValueError(self._t["config_value_invalid"] % field)
+        
+        # Cross-field check
+        if not config["COOLDOWN_SECONDS"] > config["SOURCE_DISPLAY_TIME"]:
+            raise ValueError(self._t["config_value_invalid"] % "COOLDOWN_SECONDS")
+
+        # Cache frequently used values as attributes (avoid dict lookups in the polling loop)
+        self._bitrate_threshold = config["BITRATE_THRESHOLD"]
+        self._rtt_threshold = config["RTT_THRESHOLD"]
+        self._cooldown = float(config["COOLDOWN_SECONDS"])
+        self._display_time = config["SOURCE_DISPLAY_TIME"]
+        self._scene_name = config["SCENE_NAME"]
+        self._source_name = config["SOURCE_NAME"]
+        self._stats_url = config["STATS_URL"]
+        self._publisher = config["PUBLISHER"]
+
+    def get_retry_delay(self, retry_count):
+        """Calculate reconnection wait time (exponential backoff with jitter)
+        
+        Args:
+            retry_count (int): Number of retry attempts
+            
+        Returns:
+            float: Wait time in seconds
+        """
+        # Exponentially increase from 2 seconds up to 32 seconds, then pick a random
+        # point in the upper half so clients don't reconnect in lockstep
+        base = min(2 * (2 ** min(retry_count, 16)), 32)
+        return random.uniform(base / 2, base)
+
+    def connect_to_obs(self):
+        """
+        Establish OBS WebSocket connection (main loop; owns the reconnection backoff)
+        
+        Returns:
+            bool: Connection success status
+        """
+        try:
+            self._open_obs()
+            self.obs_retry_count = 0  # Reset retry counter on successful connection
+            return True
+        except Exception as e:
+            if self.is_connected:
+                logger.error(self._t["obs_lost"])
+                self.is_connected = False
+            delay = self.obs_retry_delay = self.get_retry_delay(self.obs_retry_count)
+            logger.error(self._t["obs_connect_failed"], e, delay)
+            self.obs_retry_count += 1
+            return False
+
+    def _open_obs(self):
+        """Open a new OBS WebSocket connection and swap it in
+        - The lock is held only for the swap, never across a network call
+        
+        Raises:
+            Exception: If the connection fails
+        """
+        ws = obsws(self.config["OBS_HOST"], self.config["OBS_PORT"], self.config["OBS_PASSWORD"])
+        ws.connect()
+        with self._obs_lock:
+            old_ws, self.ws = self.ws, ws
+            self.is_connected = True
+            self._last_ping = time.monotonic()
+            self.source_id = None  # Reset source ID cache
+            self._show_payload = self._hide_payload = None
+            self._current_visible = None  # Source state unknown on a new connection
+        
+        if old_ws is not None:  # Disconnect previous connection if any
+            try:
+                old_ws.disconnect()
+            except Exception:
+                pass
+        logger.info(self._t["obs_connected"])
+        
+        # Pre-warm source ID cache so the first warning needs no extra round trip
+        try:
+            self._get_source_id()
+        except Exception:
+            pass  # Looked up again on the first warning
+
+    def ensure_obs_connection(self):
+        # Check OBS WebSocket connection status and reconnect if needed
+        if self.ws is None or not self.ws.ws.connected:
+            if self.is_connected:  # If previously connected
+                logger.error(self._t["obs_lost"])
+                self.is_connected = False
+            return self.connect_to_obs()
+        
+        # Ping periodically so a socket the OS already knows is dead (reset, unreachable) is noticed
+        # without waiting for the next OBS call; a half-open connection is not detected here
+        if time.monotonic() - self._last_ping > OBS_PING_INTERVAL:
+            try:
+                self.ws.ws.ping()
+                self._last_ping = time.monotonic()
+            except Exception:
+                if self.is_connected:
+                    logger.error(self._t["obs_lost"])
+                    self.is_connected = False
+                return self.connect_to_obs()
+        return True
+
+    def _load_config(self, config_path):
+        # Load configuration file and check required fields
+        try:
+            with open(config_path, "r") as config_file:
+                config = json.load(config_file)
+                if not all(field in config for field in CONFIG_SCHEMA):
+                    raise ValueError(self._t["config_fields_missing"])
+                return config
+        except Exception as e:
+            raise RuntimeError(self._t["config_load_failed"] % e)
+
+    def _create_session(self):
+        """Create HTTP session for the SRT stats URL
+        - Reuses a single keep-alive connection to avoid a TCP/TLS handshake on every poll
+        - urllib3 retries disabled; reconnection is handled by our own backoff
+
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        session.headers.update(STATS_HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, pool_block=False,
+                              max_retries=Retry(total=0))
+        session.mount(urlsplit(self._stats_url).scheme + "://", adapter)
+        return session
+
+    def _fetch_stats_body(self):
+        """Fetch the raw SRT stats response body
+        - Plain HTTP goes straight through http.client on a persistent connection
+        - Otherwise the requests session handles TLS, URL credentials and proxies
+        - A redirect switches the URL over to the requests session, which follows it
+
+        Returns:
+            bytes: Response body
+
+        Raises:
+            requests.exceptions.RequestException, http.client.HTTPException, OSError: If the request fails
+        """
+        if self.session is not None:
+            response = self.session.get(self._stats_url, timeout=1)
+            response.raise_for_status()
+            return response.content
+        
+        try:
+            try:
+                status, reason, body = self._http_get()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server closed the idle keep-alive connection; retry once on a fresh one
+                self._conn.close()
+                status, reason, body = self._http_get()
+        except (http.client.HTTPException, OSError):
+            self._conn.close()  # Reconnects on next request
+            raise
+        
+        if 300 <= status < 400:
+            self._conn.close()
+            self._conn = None
+            self.session = self._create_session()
+            return self._fetch_stats_body()
+        if status != 200:
+            raise http.client.HTTPException(f"{status} {reason}")
+        return body
+
+    def _http_get(self):
+        """Send one GET on the persistent connection and read the whole body
+
+        Returns:
+            tuple: (status, reason, body)
+        """
+        self._conn.request("GET", self._stats_path, headers=STATS_HEADERS)
+        response = self._conn.getresponse()
+        return response.status, response.reason, response.read()
+
+    def _fetch_bitrate(self):
+        """Fetch bitrate and RTT information from SRT server
+        
+        Returns:
+            tuple: (bitrate, RTT), or None if the server request failed
+        """
+        try:
+            body = self._fetch_stats_body()
+            
+            if not self.server_connected:
+                logger.info(self._t["server_connected"])
+                self.server_connected = True
+                self.server_retry_count = 0
+            
+            data = json.loads(body)
+            publishers = data.get("publishers", {})
+            publisher_data = publishers.get(self._publisher, {})
+            bitrate = publisher_data.get("bitrate")
+            rtt = publisher_data.get("rtt", 0)
+            
+            if bitrate is None and not self.bitrate_none_logged:
+                logger.info(self._t["no_stream"])
+                self.bitrate_none_logged = True
+            elif bitrate is not None:
+                self.bitrate_none_logged = False
+            
+            return bitrate, rtt
+
+        except (requests.exceptions.RequestException, http.client.HTTPException, OSError, ValueError) as e:
+            delay = self.server_retry_delay = self.get_retry_delay(self.server_retry_count)
+            logger.error(self._t["server_connect_failed"], e, delay)
+            self.server_connected = False
+            self.server_retry_count += 1
+            self.bitrate_none_logged = False
+            self._skip_until = 0.0  # Re-arm initial skip after reconnect
+            return None
+
+    def _toggle_warning(self, visible):
+        """Queue an OBS warning source visibility change
+        - Handled by the OBS worker thread so a slow OBS response never blocks the caller
+        - If changes pile up (OBS stalled), only the latest one is kept
+        
+        Args:
+            visible (bool): True=show, False=hide
+        """
+        if self._obs_q.qsize() >= 4:
+            try:
+                while True:
+                    self._obs_q.get_nowait()  # Drop stale change
+            except queue.Empty:
+                pass
+        self._obs_q.put(visible)
+
+    def _obs_worker(self):
+        """OBS worker thread
+        - Applies queued visibility changes in order
+        """
+        while True:
+            self._set_warning_visible(self._obs_q.get())
+
+    def _set_warning_visible(self, visible):
+        """Toggle OBS warning source visibility
+        - Skips the call if the source is already in the requested state
+        
+        Args:
+            visible (bool): True=show, False=hide
+        """
+        if visible == self._current_visible:
+            return
+        
+        try:
+            try:
+                self._send_warning_visible(visible)
+            except WebSocketConnectionClosedException:
+                # Connection dropped; reconnect once and retry in this cycle
+                # (repeated failures are left to the main loop's backoff)
+                self._open_obs()
+                self._send_warning_visible(visible)
+            self._current_visible = visible
+        except Exception as e:
+            self._current_visible = None  # Unknown state; next change is always sent
+            logger.error(self._t["toggle_error"], e)
+
+    def _send_warning_visible(self, visible):
+        """Send SetSceneItemEnabled for the warning source
+        
+        Args:
+            visible (bool): True=show, False=hide
+        """
+        while True:
+            with self._obs_lock:  # Connection and payload must belong together
+                ws = self.ws
+                payload = self._show_payload if visible else self._hide_payload
+            if payload is not None:
+                break
+            self._get_source_id()  # Not loaded yet or reset by a reconnect; reconnection is handled by the caller
+        ws.call(obsrequests.SetSceneItemEnabled(**payload))
+
+    def _load_scene_items(self):
+        """Fetch scene items once and build the source name -> scene item ID map
+        - The caches are replaced together, and only if the connection was not swapped meanwhile
+        """
+        with self._obs_lock:
+            ws = self.ws
+        scene_items = ws.call(obsrequests.GetSceneItemList(sceneName=self._scene_name))
+        scene_item_ids = {
+            item["sourceName"]: item["sceneItemId"]
+            for item in scene_items.datain["sceneItems"]
+        }
+        source_id = scene_item_ids.get(self._source_name)
+        
+        # Cache constant SetSceneItemEnabled arguments for the source
+        if source_id is None:
+            show_payload = hide_payload = None
+        else:
+            show_payload = {"sceneName": self._scene_name, "sceneItemId": source_id, "sceneItemEnabled": True}
+            hide_payload = {**show_payload, "sceneItemEnabled": False}
+        
+        with self._obs_lock:
+            if ws is self.ws:  # IDs from a replaced connection are not cached
+                self._scene_item_ids = scene_item_ids
+                self.source_id = source_id
+                self._show_payload, self._hide_payload = show_payload, hide_payload
+
+    def _get_source_id(self):
+        """Get OBS source ID (using cache)
+        - Reloads the scene item map if the source was not found yet
+        - A closed connection is raised without logging; _set_warning_visible reconnects and retries
+            
+        Returns:
+            int: Source ID
+            
+        Raises:
+            ValueError: If source not found
+            WebSocketConnectionClosedException: If the connection was closed
+        """
+        if self.source_id is None:
+            try:
+                self._load_scene_items()
+                if self.source_id is None:
+                    raise ValueError(self._t["source_not_found"] % self._source_name)
+            except WebSocketConnectionClosedException:
+                raise
+            except Exception as e:
+                logger.error(self._t["source_id_error"], e)
+                raise
+        return self.source_id
+
+    def _show_warning_for_duration(self, bitrate):
+        """Optimized warning display and timer management
+        
+        Args:
+            bitrate (float): Current bitrate
+        """
+        if self.warning_active:
+            self._extend_warning()
+            return
+        
+        self.warning_active = True
+        self._warning_label = self._t["low_bitrate_label"]
+        logger.warning(self._t["low_bitrate_warning"], bitrate, self._cooldown)
+        
+        try:
+            self._toggle_warning(True)
+            
+            self._schedule_hide()
+            
+        except Exception as e:
+            logger.error(self._t["show_error"], e)
+            self.warning_active = False
+
+    def _schedule_hide(self):
+        """Schedule the warning source to be hidden after SOURCE_DISPLAY_TIME
+        - Starts the waiter thread for a newly shown warning; use _extend_warning while it is shown
+        """
+        with self._hide_lock:
+            self._warning_clear.clear()
+            self._hide_pending = True
+        threading.Thread(target=self._hide_after_display_time, daemon=True).start()
+
+    def _extend_warning(self):
+        """Restart the display period of the warning being shown
+        
+        Returns:
+            bool: True if extended, False if the waiter has already finished waiting
+        """
+        with self._hide_lock:
+            if not self._hide_pending:
+                return False
+            self._warning_clear.set()
+            return True
+
+    def _hide_after_display_time(self):
+        """Wait SOURCE_DISPLAY_TIME (restarted whenever extended), then hide the warning"""
+        while True:
+            if self._warning_clear.wait(self._display_time):
+                self._warning_clear.clear()
+                continue
+            with self._hide_lock:
+                # An extension may have arrived just as the wait timed out
+                if not self._warning_clear.is_set():
+                    self._hide_pending = False
+                    break
+        self._hide_warning()
+
+    def _hide_warning(self):
+        """Separate method for handling warning hide"""
+        try:
+            self._toggle_warning(False)
+            self.warning_active = False
+            logger.info(self._t["warning_ended"], self._warning_label, self._source_name)
+        except Exception as e:
+            logger.error(self._t["hide_error"], e)
+
+    def _handle_low_bitrate(self, bitrate, rtt):
+        """Handle bitrate or RTT issues
+        
+        Args:
+            bitrate (float): Current bitrate
+            rtt (float): Current RTT
+        """
+        # Issue persists while the warning is shown; keep it on screen
+        if self.warning_active and self._extend_warning():
+            return
+        
+        current_time = time.monotonic()
+        if current_time - self.last_sent_time >= self._cooldown and not self.warning_active:
+            self.warning_active = True
+            self._warning_label = self._t["stream_quality_label"]
+            
+            if logger.isEnabledFor(logging.WARNING):
+                # Create warning message
+                warning_reason = []
+                if bitrate < self._bitrate_threshold:
+                    warning_reason.append(self._t["low_bitrate_reason"] % bitrate)
+                if rtt > self._rtt_threshold:
+                    warning_reason.append(self._t["high_rtt_reason"] % rtt)
+                
+                warning_msg = " / ".join(warning_reason)
+                logger.warning(self._t["stream_quality_warning"], warning_msg, self._cooldown, self._source_name)
+            
+            self._toggle_warning(True)
+            
+            self._schedule_hide()
+            self.last_sent_time = current_time
+
+    def run(self):
+        """Main monitoring loop
+        - Check bitrate and RTT samples from the sampler thread (every 2 seconds)
+        - Show warning on issues
+        - Auto-reconnect on connection loss
+        """
+        # Fetch stats and apply OBS changes on separate threads so HTTP or OBS stalls don't block the main loop
+        threading.Thread(target=self._sampler, daemon=True).start()
+        threading.Thread(target=self._obs_worker, daemon=True).start()
+        
+        while True:
+            if not self.ensure_obs_connection():
+                time.sleep(self.obs_retry_delay)
+                continue
+
+            try:
+                sample = self._sample_q.get(timeout=POLL_INTERVAL * 2)
+            except queue.Empty:
+                continue
+            
+            if isinstance(sample, Exception):
+                raise sample  # Sampler thread failed; exit through main()
+            bitrate, rtt = sample
+            
+            if bitrate is None:
+                # No stream; re-arm the initial skip for when it starts again
+                self._skip_until = 0.0
+                continue
+            
+            # Skip checks for the first seconds after the stream is detected (unstable values)
+            now = time.monotonic()
+            if self._skip_until == 0.0:
+                self._skip_until = now + INITIAL_SKIP_SECONDS
+                logger.info(self._t["stream_detected"], INITIAL_SKIP_SECONDS)
+            if now < self._skip_until:
+                continue
+            
+            # Handle warning when bitrate or RTT exceeds threshold
+            if bitrate < self._bitrate_threshold or rtt > self._rtt_threshold:
+                self._handle_low_bitrate(bitrate, rtt)
+
+    def _sampler(self):
+        """Stats sampler thread
+        - Fetch bitrate and RTT every 2 seconds, keeping only the newest sample in the queue
+        - Back off while the SRT server is unreachable
+        - An unexpected error is handed to the main loop instead of silently ending the thread
+        """
+        self._next_tick = time.monotonic()
+        try:
+            while True:
+                sample = self._fetch_bitrate()
+                
+                if sample is None:
+                    time.sleep(self.server_retry_delay)
+                    self._next_tick = time.monotonic()
+                    continue
+                
+                self._put_sample(sample)
+                self._wait_for_next_tick()
+        except Exception as e:
+            self._put_sample(e)
+
+    def _put_sample(self, sample):
+        """Replace the queued sample with a newer one
+        
+        Args:
+            sample (tuple | Exception): (bitrate, RTT), or the error that stopped the sampler
+        """
+        try:
+            self._sample_q.get_nowait()  # Drop stale sample
+        except queue.Empty:
+            pass
+        self._sample_q.put(sample)
+
+    def _wait_for_next_tick(self):
+        """Sleep until the next polling deadline
+        - Sleeps only the remainder of the interval so time spent on HTTP/OBS calls doesn't cause drift
+        - Resets the deadline if the loop fell behind (no catch-up bursts)
+        """
+        self._next_tick += POLL_INTERVAL
+        remaining = self._next_tick - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            self._next_tick = time.monotonic()
+
+def main(locale):
+    """Program entry point
+    
+    Args:
+        locale (str): Message language ("en" or "kr")
+    """
+    # Display version at startup
+    print(f"\nauto-obs-srt-bitrate-rtt-alert_{locale} v{VERSION}")
+    print("=" * 50 + "\n")
+    
+    messages = STRINGS[locale]
+    try:
+        monitor = BitrateMonitor("abc_config.json", locale)
+        monitor.run()
+    except Exception as e:
+        logger.error(messages["error_occurred"], e)
+        logger.error(messages["exit_notice"])
+        time.sleep(10)
+        raise
@@ -0,0 +1,72 @@
+"""
+Localized log and error messages for auto-obs-srt-bitrate-rtt-alert
+
+Messages use %-style placeholders and are passed to the logger as format strings.
+"""
+
+STRINGS = {
+    "en": {
+        # Configuration
+        "config_load_failed": "Failed to load configuration file: %s",
+        "config_fields_missing": "Required configuration fields are missing",
+        "config_strings_invalid": "Required string configuration values are missing or invalid",
+        "config_value_invalid": "Invalid configuration value for %s",
+        # OBS
+        "obs_connected": "OBS WebSocket connection successful",
+        "obs_lost": "OBS WebSocket connection lost",
+        "obs_connect_failed": "OBS WebSocket connection failed: %s. Retrying in %.1f seconds...",
+        "source_not_found": "Source '%s' not found in scene",
+        "source_id_error": "Error getting source ID: %s",
+        "toggle_error": "Error toggling warning visibility: %s",
+        # SRT server
+        "server_connected": "SRT server connection successful",
+        "server_connect_failed": "SRT server connection failed: %s. Retrying in %.1f seconds...",
+        "no_stream": "No stream detected. Waiting for stream to start...",
+        "stream_detected": "Stream detected. Skipping bitrate checks for the first %d seconds...",
+        # Warning
+        "low_bitrate_label": "Low bitrate warning",
+        "low_bitrate_warning": "Low bitrate warning - %s kbps (Next alert in: %g seconds)",
+        "stream_quality_label": "Stream quality warning",
+        "stream_quality_warning": "Stream quality warning - %s (Next alert in: %g seconds) [%s shown]",
+        "low_bitrate_reason": "Low bitrate: %s kbps",
+        "high_rtt_reason": "High RTT: %s ms",
+        "warning_ended": "%s ended [%s hidden]",
+        "show_error": "Error occurred while showing warning: %s",
+        "hide_error": "Error occurred while hiding warning: %s",
+        # Program
+        "error_occurred": "Error occurred: %s",
+        "exit_notice": "Program will exit in 10 seconds.",
+    },
+    "kr": {
+        # 설정
+        "config_load_failed": "설정 파일 로드 실패: %s",
+        "config_fields_missing": "필수 설정 필드가 누락되었습니다",
+        "config_strings_invalid": "필수 문자열 설정값이 누락되었거나 올바르지 않습니다",
+        "config_value_invalid": "%s 설정값이 올바르지 않습니다",
+        # OBS
+        "obs_connected": "OBS WebSocket 연결 성공",
+        "obs_lost": "OBS WebSocket 연결이 끊어졌습니다",
+        "obs_connect_failed": "OBS WebSocket 연결 실패: %s. %.1f초 후 재시도...",
+        "source_not_found": "소스 '%s'를 장면에서 찾을 수 없습니다",
+        "source_id_error": "소스 ID 가져오기 오류: %s",
+        "toggle_error": "경고 표시/숨김 오류: %s",
+        # SRT 서버
+        "server_connected": "SRT 서버 연결 성공",
+        "server_connect_failed": "SRT 서버 연결 안됨: %s. %.1f초 후 재시도...",
+        "no_stream": "스트림 없음. 스트림이 시작될 때까지 대기 중...",
+        "stream_detected": "스트림 감지됨. 처음 %d초 동안은 비트레이트 체크를 건너뜁니다...",
+        # 경고
+        "low_bitrate_label": "낮은 비트레이트 경고",
+        "low_bitrate_warning": "낮은 비트레이트 경고 - %s kbps (재알림 대기: %g초)",
+        "stream_quality_label": "스트림 품질 경고",
+        "stream_quality_warning": "스트림 품질 경고 - %s (재알림 대기: %g초) [%s 표시됨]",
+        "low_bitrate_reason": "낮은 비트레이트: %s kbps",
+        "high_rtt_reason": "높은 RTT: %s ms",
+        "warning_ended": "%s 종료 [%s 숨김]",
+        "show_error": "경고 표시 중 오류 발생: %s",
+        "hide_error": "경고 숨김 중 오류 발생: %s",
+        # 프로그램
+        "error_occurred": "에러 발생: %s",
+        "exit_notice": "프로그램이 10초 후 종료됩니다.",
+    },
+}